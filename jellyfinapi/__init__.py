@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import sys
+from functools import lru_cache
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from platform import uname
 from uuid import getnode
 
@@ -17,21 +19,48 @@ CONFIG = JellyfinConfig(CONFIG_PATH)
 # JellyfinAPI Settings
 PROJECT = 'JellyfinAPI'
 VERSION = __version__ = const.__version__
-TIMEOUT = CONFIG.get('jellyfinapi.timeout', 30, int)
-X_PLEX_CONTAINER_SIZE = CONFIG.get('jellyfinapi.container_size', 100, int)
-X_PLEX_ENABLE_FAST_CONNECT = CONFIG.get('jellyfinapi.enable_fast_connect', False, bool)
-
-# Jellyfin Header Configuration
-X_PLEX_PROVIDES = CONFIG.get('header.provides', 'controller')
-X_PLEX_PLATFORM = CONFIG.get('header.platform', uname()[0])
-X_PLEX_PLATFORM_VERSION = CONFIG.get('header.platform_version', uname()[2])
-X_PLEX_PRODUCT = CONFIG.get('header.product', PROJECT)
-X_PLEX_VERSION = CONFIG.get('header.version', VERSION)
-X_PLEX_DEVICE = CONFIG.get('header.device', X_PLEX_PLATFORM)
-X_PLEX_DEVICE_NAME = CONFIG.get('header.device_name', uname()[1])
-X_PLEX_IDENTIFIER = CONFIG.get('header.identifier', str(hex(getnode())))
-X_PLEX_LANGUAGE = CONFIG.get('header.language', 'en')
-BASE_HEADERS = reset_base_headers()
+
+
+def _setting(name):
+    """ Returns the current value of the setting <name>, loading it if required. """
+    return getattr(sys.modules[__name__], name)
+
+
+@lru_cache(maxsize=1)
+def _uname():
+    """ Returns the cached platform uname, shared by the platform header defaults. """
+    return uname()
+
+
+# Settings and Jellyfin header configuration are loaded on first access (see __getattr__)
+_LAZY_SETTINGS = {
+    'TIMEOUT': lambda: CONFIG.get('jellyfinapi.timeout', 30, int),
+    'X_PLEX_CONTAINER_SIZE': lambda: CONFIG.get('jellyfinapi.container_size', 100, int),
+    'X_PLEX_ENABLE_FAST_CONNECT': lambda: CONFIG.get('jellyfinapi.enable_fast_connect', False, bool),
+    'X_PLEX_PROVIDES': lambda: CONFIG.get('header.provides', 'controller'),
+    'X_PLEX_PLATFORM': lambda: CONFIG.get('header.platform', _uname().system),
+    'X_PLEX_PLATFORM_VERSION': lambda: CONFIG.get('header.platform_version', _uname().release),
+    'X_PLEX_PRODUCT': lambda: CONFIG.get('header.product', PROJECT),
+    'X_PLEX_VERSION': lambda: CONFIG.get('header.version', VERSION),
+    'X_PLEX_DEVICE': lambda: CONFIG.get('header.device', _setting('X_PLEX_PLATFORM')),
+    'X_PLEX_DEVICE_NAME': lambda: CONFIG.get('header.device_name', _uname().node),
+    'X_PLEX_IDENTIFIER': lambda: CONFIG.get('header.identifier', str(hex(getnode()))),
+    'X_PLEX_LANGUAGE': lambda: CONFIG.get('header.language', 'en'),
+    'BASE_HEADERS': reset_base_headers,
+}
+
+
+def __getattr__(name):
+    """ Loads the lazy settings above on first access. The value is stored as a regular module
+        attribute, so later lookups skip this hook and overriding a setting works as before.
+    """
+    try:
+        loader = _LAZY_SETTINGS[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = globals()[name] = loader()
+    return value
+
 
 # Logging Configuration
 log = logging.getLogger('jellyfinapi')
@@ -43,9 +72,15 @@ loghandler = logging.NullHandler()
 if logfile:  # pragma: no cover
     logbackups = CONFIG.get('log.backup_count', 3, int)
     logbytes = CONFIG.get('log.rotate_bytes', 512000, int)
-    loghandler = RotatingFileHandler(os.path.expanduser(logfile), 'a', logbytes, logbackups)
+    logcapacity = CONFIG.get('log.batch_capacity', 1024, int)
+    logfilehandler = RotatingFileHandler(os.path.expanduser(logfile), 'a', logbytes, logbackups)
+    logfilehandler.setFormatter(logging.Formatter(logformat))
+    # Buffer records and write them to the log file in batches (or immediately on warnings),
+    # logging.shutdown() flushes and closes both handlers at exit
+    loghandler = MemoryHandler(logcapacity, flushLevel=logging.WARNING, target=logfilehandler)
+else:
+    loghandler.setFormatter(logging.Formatter(logformat))
 
-loghandler.setFormatter(logging.Formatter(logformat))
 log.addHandler(loghandler)
 log.setLevel(loglevel)
 logfilter = SecretsFilter()
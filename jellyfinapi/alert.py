@@ -1,11 +1,22 @@
 # -*- coding: utf-8 -*-
-import json
+import logging
+import queue
 import socket
 from typing import Callable
 import threading
 
 from jellyfinapi import log
 
+try:
+    from orjson import loads as jsonLoads
+except ImportError:
+    from json import loads as jsonLoads
+
+try:
+    import websocket
+except ImportError:
+    websocket = None
+
 
 class AlertListener(threading.Thread):
     """ Creates a websocket connection to the JellyfinServer to optionally receive alert notifications.
@@ -34,7 +45,10 @@ class AlertListener(threading.Thread):
             callbackError (func): Callback function to call on errors. The callback function
                 will be sent a single argument 'error' which will contain the Error object.
                 :samp:`def my_callback(error): ...`
-            ws_socket (socket): Socket to use for the connection. If not specified, a new socket will be created.
+            ws_socket (socket): Socket to use for the connection. If not specified, the listener shares a
+                single websocket connection with all other listeners of the same server. Messages are
+                still queued to each listener and the callbacks run on the listener's own thread, so a
+                slow callback does not hold up the other listeners.
     """
     key = '/:/websockets/notifications'
 
@@ -46,13 +60,20 @@ class AlertListener(threading.Thread):
         self._callbackError = callbackError
         self._socket = ws_socket
         self._ws = None
+        self._queue = queue.Queue()
 
     def run(self):
-        try:
-            import websocket
-        except ImportError:
+        if websocket is None:
             log.warning("Can't use the AlertListener without websocket")
             return
+        if self._socket is None:
+            # share the server's websocket connection with any other listeners
+            hub = _AlertHub.subscribe(self._server, self)
+            # run the callbacks for the hub's messages until stopped (None)
+            for handler, arg in iter(self._queue.get, None):
+                handler(arg)
+            hub.unsubscribe(self)
+            return
         # create the websocket connection
         url = self._server.url(self.key, includeToken=True).replace('http', 'ws')
         log.info('Starting AlertListener: %s', url)
@@ -67,17 +88,22 @@ class AlertListener(threading.Thread):
             from a JellyfinServer instance.
         """
         log.info('Stopping AlertListener.')
-        self._ws.close()
+        self._queue.put(None)
+        if self._ws:
+            self._ws.close()
 
     def _onMessage(self, *args):
-        """ Called when websocket message is received.
+        """ Called when websocket message is received on this listener's own connection.
 
             We are assuming the last argument in the tuple is the message.
         """
-        message = args[-1]
+        data = _parseMessage(args[-1])
+        if data is not None:
+            self._dispatch(data)
+
+    def _dispatch(self, data):
+        """ Sends the parsed notification data to the callback function. """
         try:
-            data = json.loads(message)['NotificationContainer']
-            log.debug('Alert: %s %s %s', *data)
             if self._callback:
                 self._callback(data)
         except Exception as err:  # pragma: no cover
@@ -95,3 +121,89 @@ class AlertListener(threading.Thread):
                 self._callbackError(err)
         except Exception as err:  # pragma: no cover
             log.error('AlertListener Error: Error: %s', err)
+
+
+class _AlertHub:
+    """ Single websocket connection to a JellyfinServer shared by all of its
+        :class:`~jellyfinapi.alert.AlertListener` objects. Each message is parsed once
+        and the resulting data is queued to every subscribed listener.
+
+        Parameters:
+            url (str): Websocket url of the server notifications endpoint.
+    """
+    _hubs = {}
+    _lock = threading.Lock()
+
+    def __init__(self, url):
+        self._url = url
+        self._listeners = []
+        self._ws = None
+
+    @classmethod
+    def subscribe(cls, server, listener):
+        """ Adds the listener to the hub of the specified server, connecting the hub
+            if this is the first listener. Returns the hub.
+        """
+        url = server.url(AlertListener.key, includeToken=True).replace('http', 'ws')
+        with cls._lock:
+            hub = cls._hubs.get(url)
+            if hub is None:
+                hub = cls._hubs[url] = cls(url)
+                hub._connect()
+            hub._listeners.append(listener)
+        return hub
+
+    def unsubscribe(self, listener):
+        """ Removes the listener from the hub, closing the connection after the last one. """
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            if self._listeners:
+                return
+            if self._hubs.get(self._url) is self:
+                del self._hubs[self._url]
+        self._ws.close()
+
+    def _connect(self):
+        log.info('Starting AlertListener: %s', self._url)
+        self._ws = websocket.WebSocketApp(self._url, on_message=self._onMessage, on_error=self._onError)
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        self._ws.run_forever()
+        # the connection is gone, release the listeners still waiting on it
+        with self._lock:
+            if self._hubs.get(self._url) is self:
+                del self._hubs[self._url]
+            listeners, self._listeners = self._listeners, []
+        for listener in listeners:
+            listener._queue.put(None)
+
+    def _onMessage(self, *args):
+        """ Called when websocket message is received.
+
+            We are assuming the last argument in the tuple is the message.
+        """
+        data = _parseMessage(args[-1])
+        if data is not None:
+            for listener in list(self._listeners):
+                listener._queue.put((listener._dispatch, data))
+
+    def _onError(self, *args):  # pragma: no cover
+        """ Called when websocket error is received.
+
+            We are assuming the last argument in the tuple is the message.
+        """
+        for listener in list(self._listeners):
+            listener._queue.put((listener._onError, args[-1]))
+
+
+def _parseMessage(message):
+    """ Returns the notification data from a websocket message or None if it can't be parsed. """
+    try:
+        data = jsonLoads(message)['NotificationContainer']
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('Alert: %r', data)
+        return data
+    except Exception as err:  # pragma: no cover
+        log.error('AlertListener Msg Error: %s', err)
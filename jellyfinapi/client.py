@@ -187,17 +187,23 @@ class JellyfinClient(JellyfinObject):
         log.debug('%s %s', method.__name__.upper(), url)
         headers = self._headers(**headers or {})
         response = method(url, headers=headers, timeout=timeout, **kwargs)
-        if response.status_code not in (200, 201, 204):
-            codename = codes.get(response.status_code)[0]
-            errtext = response.text.replace('\n', ' ')
-            message = f'({response.status_code}) {codename}; {response.url} {errtext}'
-            if response.status_code == 401:
+        return self._processResponse(response.status_code, response.url, response.text)
+
+    def _processResponse(self, status, url, text):
+        """ Raises the matching JellyfinAPI exception if the response <status> is not successful,
+            otherwise returns the response <text> parsed into an ElementTree object or None.
+        """
+        if status not in (200, 201, 204):
+            codename = codes.get(status)[0]
+            errtext = text.replace('\n', ' ')
+            message = f'({status}) {codename}; {url} {errtext}'
+            if status == 401:
                 raise Unauthorized(message)
-            elif response.status_code == 404:
+            elif status == 404:
                 raise NotFound(message)
             else:
                 raise BadRequest(message)
-        data = response.text.encode('utf8')
+        data = text.encode('utf8')
         return ElementTree.fromstring(data) if data.strip() else None
 
     def sendCommand(self, command, proxy=None, **params):
@@ -325,13 +331,13 @@ class JellyfinClient(JellyfinObject):
                 media (:class:`~jellyfinapi.media.Media`): Media object to navigate to.
                 **params (dict): Additional GET parameters to include with the command.
         """
-        server_url = media._server._baseurl.split(':')
+        server_protocol, server_address, server_port = media._server._parsedBaseurl
         command = {
             'machineIdentifier': media._server.machineIdentifier,
-            'address': server_url[1].strip('/'),
-            'port': server_url[-1],
+            'address': server_address,
+            'port': server_port,
             'key': media.key,
-            'protocol': server_url[0],
+            'protocol': server_protocol,
             **params,
         }
         token = media._server.createToken()
@@ -495,8 +501,7 @@ class JellyfinClient(JellyfinObject):
                 **params (dict): Optional additional parameters to include in the playback request. See
                     also: https://github.com/jellyfininc/jellyfin-media-player/wiki/Remote-control-API#modified-commands
         """
-        server_url = media._server._baseurl.split(':')
-        server_port = server_url[-1].strip('/')
+        server_protocol, server_address, server_port = media._server._parsedBaseurl
 
         if hasattr(media, "playlistType"):
             mediatype = media.playlistType
@@ -514,8 +519,8 @@ class JellyfinClient(JellyfinObject):
         command = {
             'providerIdentifier': 'com.jellyfinapp.plugins.library',
             'machineIdentifier': media._server.machineIdentifier,
-            'protocol': server_url[0],
-            'address': server_url[1].strip('/'),
+            'protocol': server_protocol,
+            'address': server_address,
             'port': server_port,
             'offset': offset,
             'key': media.key or playqueue.selectedItem.key,
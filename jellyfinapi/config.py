@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 import os
-from collections import defaultdict
-from configparser import ConfigParser
+import re
+from functools import lru_cache
 
 from jellyfinapi import utils
 
 
-class JellyfinConfig(ConfigParser):
+class JellyfinConfig:
     """ JellyfinAPI configuration object. Settings are stored in an INI file within the
         user's home directory and can be overridden after importing jellyfinapi by simply
         setting the value. See the documentation section 'Configuration' for more
@@ -15,11 +15,11 @@ class JellyfinConfig(ConfigParser):
         Parameters:
             path (str): Path of the configuration file to load.
     """
+    _section_re = re.compile(r'^\[(.+)\]\s*$')
+    _kv_re = re.compile(r'^\s*([^=:;#\s][^=:]*?)\s*[=:]\s*(.*?)\s*$')
 
     def __init__(self, path):
-        ConfigParser.__init__(self)
-        self.read(path)
-        self.data = self._asDict()
+        self.data = self._load(path)
 
     def get(self, key, default=None, cast=None):
         """ Returns the specified configuration value or <default> if not found.
@@ -29,30 +29,78 @@ class JellyfinConfig(ConfigParser):
                 default: Default value to use if key not found.
                 cast (func): Cast the value to the specified type before returning.
         """
+        envkey, section, name = self._parseKey(key)
+        # First: check environment variable is set
+        value = os.environ.get(envkey)
+        if value is None:
+            if section is None:
+                return default
+            # Second: check the config file has attr
+            value = self.data.get((section, name), default)
+        if not cast:
+            return value
         try:
-            # First: check environment variable is set
-            envkey = f"PLEXAPI_{key.upper().replace('.', '_')}"
-            value = os.environ.get(envkey)
-            if value is None:
-                # Second: check the config file has attr
-                section, name = key.lower().split('.')
-                value = self.data.get(section, {}).get(name, default)
-            return utils.cast(cast, value) if cast else value
-        except:  # noqa: E722
+            return utils.cast(cast, value)
+        except (TypeError, ValueError):
             return default
 
-    def _asDict(self):
-        """ Returns all configuration values as a dictionary. """
-        config = defaultdict(dict)
-        for section in self._sections:
-            for name, value in self._sections[section].items():
-                if name != '__name__':
-                    config[section.lower()][name.lower()] = value
-        return dict(config)
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _parseKey(key):
+        """ Returns the tuple (envkey, section, name) for the configuration variable <key>.
+            The section and name are None if the key is not in the format '<section>.<variable>'.
+        """
+        envkey = f"PLEXAPI_{key.upper().replace('.', '_')}"
+        parts = key.lower().split('.')
+        if len(parts) != 2:
+            return envkey, None, None
+        return envkey, parts[0], parts[1]
+
+    def _load(self, path):
+        """ Returns all configuration values in the INI file at <path> as a dictionary keyed
+            by lowercased (section, name) tuples. A missing or unreadable file is treated
+            as an empty configuration.
+        """
+        config = {}
+        try:
+            with open(path, encoding='utf-8') as handle:
+                lines = handle.read().splitlines()
+        except OSError:
+            return config
+        # like ConfigParser, values in [DEFAULT] are not part of any section
+        section, key, keyindent, blanks = None, None, 0, 0
+        for line in lines:
+            stripped = line.strip()
+            if stripped[:1] in ('#', ';'):
+                continue
+            if not stripped:
+                blanks += 1 if key else 0
+                continue
+            indent = len(line) - len(line.lstrip())
+            if key and indent > keyindent:
+                # indented lines continue the previous value, including blank lines in between
+                config[key] += '\n' * (blanks + 1) + stripped
+                blanks = 0
+                continue
+            key, blanks = None, 0
+            match = self._section_re.match(stripped)
+            if match:
+                section = match.group(1)
+                section = None if section == 'DEFAULT' else section.strip().lower()
+                continue
+            match = self._kv_re.match(line)
+            if match and section is not None:
+                key, keyindent = (section, match.group(1).lower()), indent
+                config[key] = match.group(2)
+        return config
 
 
 def reset_base_headers():
-    """ Convenience function returns a dict of all base X-Jellyfin-* headers for session requests. """
+    """ Convenience function returns a dict of all base X-Jellyfin-* headers for session requests.
+        ``jellyfinapi.BASE_HEADERS`` is built once from this function on first access and other
+        modules hold a reference to that same dict, so after changing the ``jellyfinapi.X_PLEX_*``
+        values update it in place (``jellyfinapi.BASE_HEADERS.update(reset_base_headers())``).
+    """
     import jellyfinapi
     return {
         'X-Jellyfin-Platform': jellyfinapi.X_PLEX_PLATFORM,
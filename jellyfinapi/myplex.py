@@ -119,6 +119,7 @@ class MyJellyfinAccount(JellyfinObject):
     def __init__(self, username=None, password=None, token=None, session=None, timeout=None, code=None, remember=True):
         self._token = logfilter.add_secret(token or CONFIG.get('auth.server_token'))
         self._session = session or requests.Session()
+        self._ownsSession = session is None
         self._timeout = timeout or TIMEOUT
         self._sonos_cache = []
         self._sonos_cache_timestamp = 0
@@ -232,6 +233,16 @@ class MyJellyfinAccount(JellyfinObject):
         log.debug('%s %s %s', method.__name__.upper(), url, kwargs.get('json', ''))
         headers = self._headers(**headers or {})
         response = method(url, headers=headers, timeout=timeout, **kwargs)
+        self._raiseForStatus(response)
+        if 'application/json' in response.headers.get('Content-Type', ''):
+            return response.json()
+        elif 'text/plain' in response.headers.get('Content-Type', ''):
+            return response.text.strip()
+        data = response.text.encode('utf8')
+        return ElementTree.fromstring(data) if data.strip() else None
+
+    def _raiseForStatus(self, response):
+        """ Raises the matching JellyfinAPI exception if the response was not successful. """
         if response.status_code not in (200, 201, 204):  # pragma: no cover
             codename = codes.get(response.status_code)[0]
             errtext = response.text.replace('\n', ' ')
@@ -246,12 +257,6 @@ class MyJellyfinAccount(JellyfinObject):
                 raise Unauthorized(message)
             else:
                 raise BadRequest(message)
-        if 'application/json' in response.headers.get('Content-Type', ''):
-            return response.json()
-        elif 'text/plain' in response.headers.get('Content-Type', ''):
-            return response.text.strip()
-        data = response.text.encode('utf8')
-        return ElementTree.fromstring(data) if data.strip() else None
 
     def ping(self):
         """ Ping the Jellyfin.tv API.
@@ -302,8 +307,13 @@ class MyJellyfinAccount(JellyfinObject):
         t = time.time()
         if t - self._sonos_cache_timestamp > 5:
             self._sonos_cache_timestamp = t
-            data = self.query('https://sonos.jellyfin.tv/resources')
-            self._sonos_cache = [JellyfinSonosClient(self, elem) for elem in data]
+            url = 'https://sonos.jellyfin.tv/resources'
+            log.debug('GET %s', url)
+            # stream the response into the parser instead of building the whole document first
+            with self._session.get(url, headers=self._headers(), timeout=self._timeout, stream=True) as response:
+                self._raiseForStatus(response)
+                response.raw.decode_content = True
+                self._sonos_cache = list(JellyfinSonosClient.fromIterparse(self, response.raw))
 
         return self._sonos_cache
 
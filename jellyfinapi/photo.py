@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
 from urllib.parse import quote_plus
 
@@ -13,6 +15,12 @@ from jellyfinapi.mixins import (
 )
 
 
+def _metadataDirectory(guid):
+    """ Returns the Jellyfin Media Server photo metadata directory for the specified guid. """
+    guid_hash = utils.sha1hash(guid)
+    return str(Path('Metadata') / 'Photos' / guid_hash[0] / f'{guid_hash[1:]}.bundle')
+
+
 @utils.registerJellyfinObject
 class Photoalbum(
     JellyfinPartialObject,
@@ -49,29 +57,31 @@ class Photoalbum(
     TAG = 'Directory'
     TYPE = 'photo'
     _searchType = 'photoalbum'
+    listType = 'photo'
 
     def _loadData(self, data):
         """ Load attribute values from Jellyfin XML response. """
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
-        self.art = data.attrib.get('art')
-        self.composite = data.attrib.get('composite')
+        get = data.attrib.get
+        self.addedAt = utils.toDatetime(get('addedAt'))
+        self.art = get('art')
+        self.composite = get('composite')
         self.fields = self.findItems(data, media.Field)
-        self.guid = data.attrib.get('guid')
-        self.index = utils.cast(int, data.attrib.get('index'))
-        self.key = data.attrib.get('key', '').replace('/children', '')  # FIX_BUG_50
-        self.lastRatedAt = utils.toDatetime(data.attrib.get('lastRatedAt'))
-        self.librarySectionID = utils.cast(int, data.attrib.get('librarySectionID'))
-        self.librarySectionKey = data.attrib.get('librarySectionKey')
-        self.librarySectionTitle = data.attrib.get('librarySectionTitle')
-        self.listType = 'photo'
-        self.ratingKey = utils.cast(int, data.attrib.get('ratingKey'))
-        self.summary = data.attrib.get('summary')
-        self.thumb = data.attrib.get('thumb')
-        self.title = data.attrib.get('title')
-        self.titleSort = data.attrib.get('titleSort', self.title)
-        self.type = data.attrib.get('type')
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt'))
-        self.userRating = utils.cast(float, data.attrib.get('userRating'))
+        self.guid = get('guid')
+        self.index = utils.cast(int, get('index'))
+        key = get('key', '')
+        self.key = key[:-len('/children')] if key.endswith('/children') else key  # FIX_BUG_50
+        self.lastRatedAt = utils.toDatetime(get('lastRatedAt'))
+        self.librarySectionID = utils.cast(int, get('librarySectionID'))
+        self.librarySectionKey = get('librarySectionKey')
+        self.librarySectionTitle = get('librarySectionTitle')
+        self.ratingKey = utils.cast(int, get('ratingKey'))
+        self.summary = get('summary')
+        self.thumb = get('thumb')
+        self.title = get('title')
+        self.titleSort = get('titleSort', self.title)
+        self.type = get('type')
+        self.updatedAt = utils.toDatetime(get('updatedAt'))
+        self.userRating = utils.cast(float, get('userRating'))
 
     def album(self, title):
         """ Returns the :class:`~jellyfinapi.photo.Photoalbum` that matches the specified title.
@@ -115,9 +125,16 @@ class Photoalbum(
         key = f'{self.key}/children'
         return self.fetchItems(key, video.Clip, **kwargs)
 
+    def _children(self):
+        """ Returns a list of all :class:`~jellyfinapi.photo.Photoalbum`, :class:`~jellyfinapi.photo.Photo`
+            and :class:`~jellyfinapi.video.Clip` objects in the album from a single request.
+        """
+        key = f'{self.key}/children'
+        return self.fetchItems(key)
+
     def get(self, title):
         """ Alias to :func:`~jellyfinapi.photo.Photoalbum.photo`. """
-        return self.episode(title)
+        return self.photo(title)
 
     def download(self, savepath=None, keep_original_name=False, subfolders=False):
         """ Download all photos and clips from the photo album. See :func:`~jellyfinapi.base.Playable.download` for details.
@@ -128,11 +145,20 @@ class Photoalbum(
                     a friendlier filename is generated.
                 subfolders (bool): True to separate photos/clips in to photo album folders.
         """
+        albums, photos, clips = [], [], []
+        for item in self._children():
+            if isinstance(item, Photoalbum):
+                albums.append(item)
+            elif isinstance(item, Photo):
+                photos.append(item)
+            elif isinstance(item, video.Clip):
+                clips.append(item)
+
         filepaths = []
-        for album in self.albums():
+        for album in albums:
             _savepath = os.path.join(savepath, album.title) if subfolders else savepath
             filepaths += album.download(_savepath, keep_original_name)
-        for photo in self.photos() + self.clips():
+        for photo in chain(photos, clips):
             filepaths += photo.download(savepath, keep_original_name)
         return filepaths
 
@@ -140,11 +166,10 @@ class Photoalbum(
         """ Get the Jellyfin Web URL with the correct parameters. """
         return self._server._buildWebURL(base=base, endpoint='details', key=self.key, legacy=1)
 
-    @property
+    @cached_property
     def metadataDirectory(self):
         """ Returns the Jellyfin Media Server data directory where the metadata is stored. """
-        guid_hash = utils.sha1hash(self.guid)
-        return str(Path('Metadata') / 'Photos' / guid_hash[0] / f'{guid_hash[1:]}.bundle')
+        return _metadataDirectory(self.guid)
 
 
 @utils.registerJellyfinObject
@@ -195,41 +220,42 @@ class Photo(
     TAG = 'Photo'
     TYPE = 'photo'
     METADATA_TYPE = 'photo'
+    listType = 'photo'
 
     def _loadData(self, data):
         """ Load attribute values from Jellyfin XML response. """
         Playable._loadData(self, data)
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
-        self.createdAtAccuracy = data.attrib.get('createdAtAccuracy')
-        self.createdAtTZOffset = utils.cast(int, data.attrib.get('createdAtTZOffset'))
+        get = data.attrib.get
+        self.addedAt = utils.toDatetime(get('addedAt'))
+        self.createdAtAccuracy = get('createdAtAccuracy')
+        self.createdAtTZOffset = utils.cast(int, get('createdAtTZOffset'))
         self.fields = self.findItems(data, media.Field)
-        self.guid = data.attrib.get('guid')
-        self.index = utils.cast(int, data.attrib.get('index'))
-        self.key = data.attrib.get('key', '')
-        self.lastRatedAt = utils.toDatetime(data.attrib.get('lastRatedAt'))
-        self.librarySectionID = utils.cast(int, data.attrib.get('librarySectionID'))
-        self.librarySectionKey = data.attrib.get('librarySectionKey')
-        self.librarySectionTitle = data.attrib.get('librarySectionTitle')
-        self.listType = 'photo'
+        self.guid = get('guid')
+        self.index = utils.cast(int, get('index'))
+        self.key = get('key', '')
+        self.lastRatedAt = utils.toDatetime(get('lastRatedAt'))
+        self.librarySectionID = utils.cast(int, get('librarySectionID'))
+        self.librarySectionKey = get('librarySectionKey')
+        self.librarySectionTitle = get('librarySectionTitle')
         self.media = self.findItems(data, media.Media)
-        self.originallyAvailableAt = utils.toDatetime(data.attrib.get('originallyAvailableAt'), '%Y-%m-%d')
-        self.parentGuid = data.attrib.get('parentGuid')
-        self.parentIndex = utils.cast(int, data.attrib.get('parentIndex'))
-        self.parentKey = data.attrib.get('parentKey')
-        self.parentRatingKey = utils.cast(int, data.attrib.get('parentRatingKey'))
-        self.parentThumb = data.attrib.get('parentThumb')
-        self.parentTitle = data.attrib.get('parentTitle')
-        self.ratingKey = utils.cast(int, data.attrib.get('ratingKey'))
-        self.sourceURI = data.attrib.get('source')  # remote playlist item
-        self.summary = data.attrib.get('summary')
+        self.originallyAvailableAt = utils.toDatetime(get('originallyAvailableAt'), '%Y-%m-%d')
+        self.parentGuid = get('parentGuid')
+        self.parentIndex = utils.cast(int, get('parentIndex'))
+        self.parentKey = get('parentKey')
+        self.parentRatingKey = utils.cast(int, get('parentRatingKey'))
+        self.parentThumb = get('parentThumb')
+        self.parentTitle = get('parentTitle')
+        self.ratingKey = utils.cast(int, get('ratingKey'))
+        self.sourceURI = get('source')  # remote playlist item
+        self.summary = get('summary')
         self.tags = self.findItems(data, media.Tag)
-        self.thumb = data.attrib.get('thumb')
-        self.title = data.attrib.get('title')
-        self.titleSort = data.attrib.get('titleSort', self.title)
-        self.type = data.attrib.get('type')
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt'))
-        self.userRating = utils.cast(float, data.attrib.get('userRating'))
-        self.year = utils.cast(int, data.attrib.get('year'))
+        self.thumb = get('thumb')
+        self.title = get('title')
+        self.titleSort = get('titleSort', self.title)
+        self.type = get('type')
+        self.updatedAt = utils.toDatetime(get('updatedAt'))
+        self.userRating = utils.cast(float, get('userRating'))
+        self.year = utils.cast(int, get('year'))
 
     def _prettyfilename(self):
         """ Returns a filename for use in download. """
@@ -300,11 +326,10 @@ class Photo(
         """ Get the Jellyfin Web URL with the correct parameters. """
         return self._server._buildWebURL(base=base, endpoint='details', key=self.parentKey, legacy=1)
 
-    @property
+    @cached_property
     def metadataDirectory(self):
         """ Returns the Jellyfin Media Server data directory where the metadata is stored. """
-        guid_hash = utils.sha1hash(self.parentGuid)
-        return str(Path('Metadata') / 'Photos' / guid_hash[0] / f'{guid_hash[1:]}.bundle')
+        return _metadataDirectory(self.parentGuid)
 
 
 @utils.registerJellyfinObject
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 from functools import cached_property
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit
 from xml.etree import ElementTree
 
 import requests
@@ -172,6 +172,15 @@ class JellyfinServer(JellyfinObject):
     def _uriRoot(self):
         return f'server://{self.machineIdentifier}/com.jellyfinapp.plugins.library'
 
+    @cached_property
+    def _parsedBaseurl(self):
+        """ Returns the (protocol, address, port) of the server baseurl as strings. The port
+            defaults to the standard port of the protocol if not specified in the baseurl.
+        """
+        url = urlsplit(self._baseurl)
+        port = url.port or (443 if url.scheme == 'https' else 80)
+        return url.scheme, url.hostname, str(port)
+
     @cached_property
     def library(self):
         """ Library to browse or search your media. """
@@ -1,11 +1,23 @@
 # -*- coding: utf-8 -*-
+import asyncio
+from functools import partial
+from xml.etree import ElementTree
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from jellyfinapi import CONFIG, X_PLEX_IDENTIFIER
+from jellyfinapi import CONFIG, X_PLEX_IDENTIFIER, log, utils
 from jellyfinapi.client import JellyfinClient
-from jellyfinapi.exceptions import BadRequest
+from jellyfinapi.exceptions import BadRequest, Unsupported
+from jellyfinapi.playlist import Playlist
 from jellyfinapi.playqueue import PlayQueue
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 
 class JellyfinSonosClient(JellyfinClient):
     """ Class for interacting with a Sonos speaker via the Jellyfin API. This class
@@ -45,71 +57,232 @@ class JellyfinSonosClient(JellyfinClient):
             _token (str): Token associated with linked Jellyfin account.
             _session (obj): Requests session object used to access this client.
     """
+    _LAZY_ATTRS = frozenset((
+        "deviceClass", "lanIP", "platform", "platformVersion", "product", "protocol", "protocolCapabilities",
+    ))
+    # playback/playMedia parameters which are the same for every command
+    _PLAYMEDIA_PARAMS = {
+        "type": "music",
+        "providerIdentifier": "com.jellyfinapp.plugins.library",
+        "X-Jellyfin-Client-Identifier": X_PLEX_IDENTIFIER,
+    }
 
     def __init__(self, account, data):
         self._data = data
-        self.deviceClass = data.attrib.get("deviceClass")
         self.machineIdentifier = data.attrib.get("machineIdentifier")
-        self.product = data.attrib.get("product")
-        self.platform = data.attrib.get("platform")
-        self.platformVersion = data.attrib.get("platformVersion")
-        self.protocol = data.attrib.get("protocol")
-        self.protocolCapabilities = data.attrib.get("protocolCapabilities")
-        self.lanIP = data.attrib.get("lanIP")
         self.title = data.attrib.get("title")
         self._baseurl = "https://sonos.jellyfin.tv"
         self._commandId = 0
         self._token = account._token
         self._session = account._session or requests.Session()
+        if (account._session is None or account._ownsSession) and self._baseurl not in self._session.adapters:
+            # mount a single pooled adapter for the Sonos API, shared by all of the account's speakers.
+            # sessions passed in by the user are left untouched.
+            retries = Retry(total=2, read=False, backoff_factor=0.2)
+            self._session.mount(self._baseurl, HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries))
+        self._timeout = account._timeout
 
         # Dummy values for JellyfinClient inheritance
         self._last_call = 0
         self._proxyThroughServer = False
         self._showSecrets = CONFIG.get("log.show_secrets", "").lower() == "true"
 
+    @classmethod
+    def fromIterparse(cls, account, stream):
+        """ Yields a :class:`~jellyfinapi.sonos.JellyfinSonosClient` for each speaker in a Jellyfin Sonos API
+            resources response, parsing the response incrementally instead of building the whole document.
+
+            Parameters:
+                account (:class:`~jellyfinapi.myjellyfin.JellyfinAccount`): JellyfinAccount instance the
+                    Sonos speakers are associated with.
+                stream (file): File-like object with the XML response, e.g. ``response.raw``.
+        """
+        root, depth = None, 0
+        for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                root = elem if root is None else root
+                depth += 1
+                continue
+            depth -= 1
+            if elem.tag == cls.TAG:
+                # keep a detached copy of the attributes, the parsed element is dropped to free memory
+                yield cls(account, ElementTree.Element(elem.tag, dict(elem.attrib)))
+            if depth == 1:
+                # remove processed children from the root so memory is bounded per speaker
+                root.remove(elem)
+
+    def __getattr__(self, attr):
+        # Less used attributes are only read from the speaker data when first accessed
+        if attr in self._LAZY_ATTRS:
+            value = self.__dict__[attr] = self._data.attrib.get(attr)
+            return value
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{attr}'")
+
     def playMedia(self, media, offset=0, **params):
+        """ Start playback of the specified music item on this speaker.
+
+            Parameters:
+                media (:class:`~jellyfinapi.media.Media`): Media item to be played back
+                    (track, album, artist, audio playlist or playqueue).
+                offset (int): Number of milliseconds at which to start playing with zero
+                    representing the beginning (default 0).
+                **params (dict): Optional additional parameters to include in the playback request.
+
+            Raises:
+                :exc:`~jellyfinapi.exceptions.BadRequest`: When the media is not music.
+        """
+        self.sendCommand("playback/playMedia", **self._playMediaParams(media, offset, **params))
+
+    async def playMediaAsync(self, media, offset=0, session=None, **params):
+        """ Coroutine version of :func:`~jellyfinapi.sonos.JellyfinSonosClient.playMedia`, which allows
+            driving several speakers concurrently. Note: ``aiohttp`` must be installed in order
+            to use this feature.
 
-        if hasattr(media, "playlistType"):
-            mediatype = media.playlistType
-        else:
-            if isinstance(media, PlayQueue):
-                mediatype = media.items[0].listType
-            else:
-                mediatype = media.listType
+            .. code-block:: python
 
-        if mediatype == "audio":
-            mediatype = "music"
-        else:
-            raise BadRequest("Sonos currently only supports music for playback")
+                async with aiohttp.ClientSession() as session:
+                    await asyncio.gather(*(s.playMediaAsync(album, session=session) for s in speakers))
 
-        server_protocol, server_address, server_port = media._server._baseurl.split(":")
-        server_address = server_address.strip("/")
-        server_port = server_port.strip("/")
+            Parameters:
+                media (:class:`~jellyfinapi.media.Media`): Media item to be played back.
+                offset (int): Number of milliseconds at which to start playing (default 0).
+                session (:class:`aiohttp.ClientSession`): Session to send the command with. A temporary
+                    session is used if not specified.
+                **params (dict): Optional additional parameters to include in the playback request.
+
+            Raises:
+                :exc:`~jellyfinapi.exceptions.BadRequest`: When the media is not music.
+                :exc:`~jellyfinapi.exceptions.Unsupported`: When aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise Unsupported("Can't use playMediaAsync without aiohttp")
+        # building the params may create a playqueue and token on the server, keep that off the event loop
+        loop = asyncio.get_running_loop()
+        command = await loop.run_in_executor(None, partial(self._playMediaParams, media, offset, **params))
+        if session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._sendCommandAsync(session, "playback/playMedia", **command)
+        return await self._sendCommandAsync(session, "playback/playMedia", **command)
+
+    async def _sendCommandAsync(self, session, command, **params):
+        """ Coroutine version of :func:`~jellyfinapi.client.JellyfinClient.sendCommand` sending the
+            command with the specified :class:`aiohttp.ClientSession`.
+        """
+        params["commandID"] = self._nextCommandId()
+        url = self.url(f"/player/{command.strip('/')}{utils.joinArgs(params)}")
+        headers = self._headers(**{"X-Jellyfin-Target-Client-Identifier": self.machineIdentifier})
+        log.debug("GET %s", url)
+        timeout = aiohttp.ClientTimeout(total=self._timeout)
+        async with session.get(url, headers=headers, timeout=timeout) as response:
+            text = await response.text()
+            return self._processResponse(response.status, response.url, text)
+
+    def _playMediaParams(self, media, offset=0, **params):
+        """ Returns the playback/playMedia command parameters for the specified media. """
+        return self._targetParams(self._playMediaCommand(media, offset, **params))
+
+    @classmethod
+    def _playMediaCommand(cls, media, offset=0, **params):
+        """ Returns the playback/playMedia command parameters shared by all speakers, creating
+            the playqueue and the server token once.
+        """
+        _checkMusic(media)
+        server_protocol, server_address, server_port = media._server._parsedBaseurl
 
         playqueue = (
             media
             if isinstance(media, PlayQueue)
             else media._server.createPlayQueue(media)
         )
-        self.sendCommand(
-            "playback/playMedia",
-            **dict(
-                {
-                    "type": "music",
-                    "providerIdentifier": "com.jellyfinapp.plugins.library",
-                    "containerKey": f"/playQueues/{playqueue.playQueueID}?own=1",
-                    "key": media.key,
-                    "offset": offset,
-                    "machineIdentifier": media._server.machineIdentifier,
-                    "protocol": server_protocol,
-                    "address": server_address,
-                    "port": server_port,
-                    "token": media._server.createToken(),
-                    "commandID": self._nextCommandId(),
-                    "X-Jellyfin-Client-Identifier": X_PLEX_IDENTIFIER,
-                    "X-Jellyfin-Token": media._server._token,
-                    "X-Jellyfin-Target-Client-Identifier": self.machineIdentifier,
-                },
-                **params
-            )
+        command = cls._PLAYMEDIA_PARAMS.copy()
+        command.update(
+            containerKey=f"/playQueues/{playqueue.playQueueID}?own=1",
+            key=media.key or playqueue.selectedItem.key,
+            offset=offset,
+            machineIdentifier=media._server.machineIdentifier,
+            protocol=server_protocol,
+            address=server_address,
+            port=server_port,
+            token=media._server.createToken(),
         )
+        command["X-Jellyfin-Token"] = media._server._token
+        command.update(params)
+        return command
+
+    def _targetParams(self, command):
+        """ Returns a copy of the shared <command> parameters targeting this speaker. """
+        return {**command, "X-Jellyfin-Target-Client-Identifier": self.machineIdentifier}
+
+
+def _checkMusic(media):
+    """ Raises :exc:`~jellyfinapi.exceptions.BadRequest` if the media can't be played on Sonos speakers. """
+    if isinstance(media, Playlist):
+        mediatype = media.playlistType
+    elif isinstance(media, PlayQueue):
+        mediatype = media.items[0].listType if media.items else None
+    else:
+        mediatype = media.listType
+
+    if mediatype != "audio":
+        raise BadRequest("Sonos currently only supports music for playback")
+
+
+def playOnAll(clients, media, offset=0, **params):
+    """ Start playback of the specified music item on several Sonos speakers at once. The playqueue
+        and server token are created once and shared by all speakers, and the commands are sent
+        concurrently.
+        Note: ``aiohttp`` must be installed in order to use this feature. This function runs its
+        own event loop and can't be called while an event loop is running (e.g. from a coroutine
+        or a Jupyter notebook), use :func:`~jellyfinapi.sonos.playOnAllAsync` there instead.
+
+        Parameters:
+            clients (List<:class:`~jellyfinapi.sonos.JellyfinSonosClient`>): Speakers to start playback on.
+            media (:class:`~jellyfinapi.media.Media`): Media item to be played back
+                (track, album, artist, audio playlist or playqueue).
+            offset (int): Number of milliseconds at which to start playing (default 0).
+            **params (dict): Optional additional parameters to include in the playback requests.
+
+        Raises:
+            :exc:`~jellyfinapi.exceptions.BadRequest`: When the media is not music.
+            :exc:`~jellyfinapi.exceptions.Unsupported`: When aiohttp is not installed or an event
+                loop is already running.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(playOnAllAsync(clients, media, offset, **params))
+    raise Unsupported("Can't use playOnAll while an event loop is running, await playOnAllAsync instead")
+
+
+async def playOnAllAsync(clients, media, offset=0, **params):
+    """ Coroutine version of :func:`~jellyfinapi.sonos.playOnAll`. Every command is sent before any
+        error is raised, the first failure is raised once all of the speakers have responded.
+
+        Parameters:
+            clients (List<:class:`~jellyfinapi.sonos.JellyfinSonosClient`>): Speakers to start playback on.
+            media (:class:`~jellyfinapi.media.Media`): Media item to be played back
+                (track, album, artist, audio playlist or playqueue).
+            offset (int): Number of milliseconds at which to start playing (default 0).
+            **params (dict): Optional additional parameters to include in the playback requests.
+
+        Raises:
+            :exc:`~jellyfinapi.exceptions.BadRequest`: When the media is not music.
+            :exc:`~jellyfinapi.exceptions.Unsupported`: When aiohttp is not installed.
+    """
+    if aiohttp is None:
+        raise Unsupported("Can't use playOnAll without aiohttp")
+    # the playqueue and token are created once and the command is only retargeted per speaker
+    loop = asyncio.get_running_loop()
+    command = await loop.run_in_executor(
+        None, partial(JellyfinSonosClient._playMediaCommand, media, offset, **params)
+    )
+
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(*(
+            client._sendCommandAsync(session, "playback/playMedia", **client._targetParams(command))
+            for client in clients
+        ), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results